@@ -11,20 +11,45 @@ Run:
 Optional flags:
   --dns-timeout 3
   --smtp-timeout 8
+  --cache-ttl-max 3600
+  --no-cache
+  --workers 16
+  --output table|csv|tsv
 """
 
 from __future__ import annotations
 
 import argparse
-import re
+import asyncio
+import contextlib
+import csv
+import json
+import select
 import smtplib
 import socket
+import sqlite3
 import sys
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 try:
     import dns.exception
+    import dns.flags
     import dns.resolver
 except ImportError:
     print(
@@ -33,12 +58,44 @@ except ImportError:
     )
     sys.exit(2)
 
+try:
+    import re2 as _re  # type: ignore[import-not-found]  # linear-time matching
+except ImportError:
+    import re as _re
+
+try:
+    import ahocorasick  # type: ignore[import-not-found]  # one pass for all keywords
+
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import dns.asyncresolver
+
+    HAS_ASYNC_DNS = True
+except ImportError:  # dnspython < 2.0 has no async resolver
+    HAS_ASYNC_DNS = False
+
+
+DNS_CONCURRENCY = 32
+DNS_CACHE_SIZE = 10_000
+DNS_EDNS_PAYLOAD = 4096
+MX_CACHE_PATH = Path.home() / ".cache" / "email_check" / "mx.sqlite"
+MX_CACHE_TTL_MAX = 3600
+MX_CACHE_SCHEMA_VERSION = 2
+SMTP_MAX_RCPT_PER_CONNECTION = 100
+SMTP_WORKERS = 16
+# Above this many rows the aligned table is skipped in favour of CSV.
+TABLE_MAX_ROWS = 1000
 
 DOMAIN_VALID = "домен валиден"
 DOMAIN_ABSENT = "домен отсутствует"
 MX_INVALID = "МХ-записи отсутствуют или некорректны"
 
-EMAIL_RE = re.compile(r"^[^@\s]+@([A-Za-z0-9-]+\.)+[A-Za-z]{2,63}$")
+# Bounded quantifiers keep even stock `re` from backtracking catastrophically.
+EMAIL_RE = _re.compile(r"[^@\s]{1,64}@(?:[A-Za-z0-9-]{1,63}\.){1,10}[A-Za-z]{2,63}")
+_email_match = EMAIL_RE.fullmatch
 POLICY_KEYWORDS = (
     "policy",
     "spam",
@@ -51,12 +108,30 @@ POLICY_KEYWORDS = (
     "access denied",
 )
 
+if HAS_AHOCORASICK:
+    _POLICY_AC = ahocorasick.Automaton()
+    for _keyword in POLICY_KEYWORDS:
+        _POLICY_AC.add_word(_keyword, _keyword)
+    _POLICY_AC.make_automaton()
+
+    def _detect_policy(message: str) -> bool:
+        return next(_POLICY_AC.iter(message.lower()), None) is not None
+
+else:
+    _POLICY_RE = _re.compile("|".join(map(_re.escape, POLICY_KEYWORDS)))
+
+    def _detect_policy(message: str) -> bool:
+        return _POLICY_RE.search(message.lower()) is not None
+
 
 @dataclass
 class DomainCheckResult:
     status: str
     mx_hosts: List[str]
     detail: str
+    ttl: Optional[int] = None
+    # IPv4 addresses of mx_hosts[0], so SMTP can skip a blocking getaddrinfo.
+    mx_ips: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -83,11 +158,39 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=8.0,
         help="SMTP timeout in seconds (default: 8)",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--cache-ttl-max",
+        type=int,
+        default=MX_CACHE_TTL_MAX,
+        help=f"Upper bound for cached MX TTL in seconds (default: {MX_CACHE_TTL_MAX})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write the on-disk MX cache ({MX_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SMTP_WORKERS,
+        help=f"Parallel SMTP probes across MX hosts (default: {SMTP_WORKERS})",
+    )
+    parser.add_argument(
+        "--output",
+        choices=("table", "csv", "tsv"),
+        default=None,
+        help=(
+            f"Output format (default: table, or csv above {TABLE_MAX_ROWS} rows)"
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    return args
 
 
 def is_valid_email(email: str) -> bool:
-    return bool(EMAIL_RE.match(email))
+    return _email_match(email) is not None
 
 
 def extract_domain(email: str) -> Optional[str]:
@@ -103,12 +206,38 @@ def extract_domain(email: str) -> Optional[str]:
         return None
 
 
-def build_resolver(timeout: float) -> dns.resolver.Resolver:
-    try:
-        resolver = dns.resolver.Resolver()
-    except dns.resolver.NoResolverConfiguration:
-        resolver = dns.resolver.Resolver(configure=False)
-        resolver.nameservers = ["1.1.1.1", "8.8.8.8"]
+# One resolver per factory, so repeated main() calls share the TTL-aware cache
+# and /etc/resolv.conf is parsed only once.
+ResolverFactory = Callable[..., dns.resolver.BaseResolver]
+ResolverT = TypeVar("ResolverT", bound=dns.resolver.BaseResolver)
+
+_RESOLVER_SINGLETONS: Dict[ResolverFactory, dns.resolver.BaseResolver] = {}
+
+
+@overload
+def build_resolver(timeout: float) -> dns.resolver.Resolver: ...
+
+
+@overload
+def build_resolver(timeout: float, factory: Callable[..., ResolverT]) -> ResolverT: ...
+
+
+def build_resolver(
+    timeout: float, factory: ResolverFactory = dns.resolver.Resolver
+) -> dns.resolver.BaseResolver:
+    resolver = _RESOLVER_SINGLETONS.get(factory)
+    if resolver is None:
+        try:
+            resolver = factory()
+        except dns.resolver.NoResolverConfiguration:
+            resolver = factory(configure=False)
+            resolver.nameservers = ["1.1.1.1", "8.8.8.8"]
+        resolver.cache = dns.resolver.LRUCache(max_size=DNS_CACHE_SIZE)
+        # EDNS0 avoids truncation of large MX sets; dnspython retries over
+        # TCP by itself when a UDP answer still comes back truncated.
+        resolver.use_edns(0, 0, DNS_EDNS_PAYLOAD)
+        resolver.flags = dns.flags.RD
+        _RESOLVER_SINGLETONS[factory] = resolver
     resolver.timeout = timeout
     resolver.lifetime = timeout
     return resolver
@@ -117,23 +246,54 @@ def build_resolver(timeout: float) -> dns.resolver.Resolver:
 def check_domain_mx(domain: str, resolver: dns.resolver.Resolver) -> DomainCheckResult:
     try:
         answers = resolver.resolve(domain, "MX")
-    except dns.resolver.NXDOMAIN:
-        return DomainCheckResult(DOMAIN_ABSENT, [], "NXDOMAIN")
-    except dns.resolver.NoAnswer:
-        return DomainCheckResult(MX_INVALID, [], "no_mx_answer")
-    except dns.resolver.NoNameservers:
-        return DomainCheckResult(MX_INVALID, [], "no_nameservers")
-    except dns.resolver.YXDOMAIN:
-        return DomainCheckResult(MX_INVALID, [], "yx_domain")
-    except dns.exception.Timeout:
-        return DomainCheckResult(MX_INVALID, [], "dns_timeout")
-    except dns.resolver.LifetimeTimeout:
-        return DomainCheckResult(MX_INVALID, [], "dns_lifetime_timeout")
-    except dns.resolver.NoResolverConfiguration:
-        return DomainCheckResult(MX_INVALID, [], "resolver_not_configured")
-    except Exception as exc:  # defensive fallback for DNS layer
-        return DomainCheckResult(MX_INVALID, [], f"dns_error:{type(exc).__name__}")
+    except Exception as exc:
+        return _dns_error_result(exc)
 
+    result = _parse_mx_answers(answers)
+    a_answers = None
+    if result.status == DOMAIN_VALID:
+        with contextlib.suppress(Exception):  # no address: smtplib uses the name
+            a_answers = resolver.resolve(result.mx_hosts[0], "A")
+    return _attach_mx_ips(result, a_answers)
+
+
+async def check_domain_mx_async(
+    domain: str, resolver: dns.asyncresolver.Resolver
+) -> DomainCheckResult:
+    try:
+        answers = await resolver.resolve(domain, "MX")
+    except Exception as exc:
+        return _dns_error_result(exc)
+
+    result = _parse_mx_answers(answers)
+    a_answers = None
+    if result.status == DOMAIN_VALID:
+        with contextlib.suppress(Exception):  # no address: smtplib uses the name
+            a_answers = await resolver.resolve(result.mx_hosts[0], "A")
+    return _attach_mx_ips(result, a_answers)
+
+
+def _dns_error_result(exc: Exception) -> DomainCheckResult:
+    if isinstance(exc, dns.resolver.NXDOMAIN):
+        return DomainCheckResult(DOMAIN_ABSENT, [], "NXDOMAIN")
+    if isinstance(exc, dns.resolver.NoAnswer):
+        detail = "no_mx_answer"
+    elif isinstance(exc, dns.resolver.NoNameservers):
+        detail = "no_nameservers"
+    elif isinstance(exc, dns.resolver.YXDOMAIN):
+        detail = "yx_domain"
+    elif isinstance(exc, dns.exception.Timeout):
+        detail = "dns_timeout"
+    elif isinstance(exc, dns.resolver.LifetimeTimeout):
+        detail = "dns_lifetime_timeout"
+    elif isinstance(exc, dns.resolver.NoResolverConfiguration):
+        detail = "resolver_not_configured"
+    else:  # defensive fallback for DNS layer
+        detail = f"dns_error:{type(exc).__name__}"
+    return DomainCheckResult(MX_INVALID, [], detail)
+
+
+def _parse_mx_answers(answers) -> DomainCheckResult:
     parsed: List[Tuple[int, str]] = []
     for record in answers:
         try:
@@ -147,46 +307,162 @@ def check_domain_mx(domain: str, resolver: dns.resolver.Resolver) -> DomainCheck
             continue
         parsed.append((pref, host))
 
+    ttl = _answers_ttl(answers)
     if not parsed:
-        return DomainCheckResult(MX_INVALID, [], "mx_records_invalid_or_empty")
+        return DomainCheckResult(MX_INVALID, [], "mx_records_invalid_or_empty", ttl)
+
+    # Only the most preferred exchanger is probed, so skip sorting the rest.
+    primary = min(parsed, key=itemgetter(0))[1]
+    return DomainCheckResult(DOMAIN_VALID, [primary], "mx_ok", ttl)
+
 
-    parsed.sort(key=lambda item: item[0])
-    mx_hosts = [host for _, host in parsed]
-    return DomainCheckResult(DOMAIN_VALID, mx_hosts, "mx_ok")
+def _attach_mx_ips(result: DomainCheckResult, a_answers) -> DomainCheckResult:
+    if a_answers is None:
+        return result
+    result.mx_ips = [record.address for record in a_answers]
+    a_ttl = _answers_ttl(a_answers)
+    if a_ttl is not None and result.ttl is not None:
+        result.ttl = min(result.ttl, a_ttl)
+    return result
+
+
+def _answers_ttl(answers) -> Optional[int]:
+    try:
+        return int(answers.rrset.ttl)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class MxCache:
+    """On-disk MX cache that expires entries together with their DNS TTL."""
+
+    def __init__(self, path: Path, ttl_max: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl_max = ttl_max
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != MX_CACHE_SCHEMA_VERSION:
+            # It is only a cache: drop entries written in an older layout.
+            self._conn.execute("DROP TABLE IF EXISTS mx")
+            self._conn.execute(f"PRAGMA user_version={MX_CACHE_SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS mx("
+            "domain TEXT PRIMARY KEY, hosts TEXT, ips TEXT, status TEXT, "
+            "detail TEXT, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, domain: str) -> Optional[DomainCheckResult]:
+        row = self._conn.execute(
+            "SELECT hosts, ips, status, detail FROM mx "
+            "WHERE domain=? AND expires_at>?",
+            (domain, time.time()),
+        ).fetchone()
+        if row is None:
+            return None
+        hosts, ips, status, detail = row
+        return DomainCheckResult(
+            status, json.loads(hosts), detail, mx_ips=json.loads(ips)
+        )
+
+    def put_many(self, results: Dict[str, DomainCheckResult]) -> None:
+        now = time.time()
+        # Only answers carrying a TTL are cacheable; errors and timeouts are not.
+        rows = [
+            (
+                domain,
+                json.dumps(result.mx_hosts),
+                json.dumps(result.mx_ips),
+                result.status,
+                result.detail,
+                now + min(result.ttl, self._ttl_max),
+            )
+            for domain, result in results.items()
+            if result.ttl is not None
+        ]
+        # One write transaction per run keeps lock contention with other
+        # processes sharing the WAL database short.
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO mx"
+                "(domain, hosts, ips, status, detail, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_mx_cache(ttl_max: int) -> Optional[MxCache]:
+    try:
+        return MxCache(MX_CACHE_PATH, ttl_max)
+    except (OSError, sqlite3.Error) as exc:
+        _warn_cache_disabled(exc)
+        return None
+
+
+def _warn_cache_disabled(exc: Exception) -> None:
+    print(f"MX cache disabled: {exc}", file=sys.stderr)
+
+
+POLICY_SENSITIVE_CODES = (550, 551, 553)
 
 
 def classify_smtp(code: int, message: str) -> str:
-    lowered = message.lower()
+    # Only "mailbox unavailable" replies look at the text, so skip the scan otherwise.
+    policy = code in POLICY_SENSITIVE_CODES and _detect_policy(message)
+    return _classify(code, policy)
+
+
+@lru_cache(maxsize=None)
+def _classify(code: int, policy: bool) -> str:
     if code in (250, 251):
         return "exists_likely"
-    if code in (550, 551, 553):
-        if any(keyword in lowered for keyword in POLICY_KEYWORDS):
+    if code in POLICY_SENSITIVE_CODES:
+        if policy:
             return "server_blocked"
         return "not_exists"
     if code in (421, 450, 451, 452):
         return "temp_fail"
-    if code in (530, 535, 554):
-        return "server_blocked"
-    if any(keyword in lowered for keyword in POLICY_KEYWORDS):
-        return "server_blocked"
     return "server_blocked"
 
 
-def smtp_probe(email: str, mx_host: str, timeout: float) -> SmtpCheckResult:
-    try:
-        with smtplib.SMTP(host=mx_host, port=25, timeout=timeout) as smtp:
-            code, message = smtp.ehlo()
-            if code >= 400:
-                code, message = smtp.helo()
-                if code >= 400:
-                    decoded = _decode_smtp_message(message)
-                    return SmtpCheckResult(
-                        "server_blocked",
-                        str(code),
-                        f"helo_rejected:{decoded}",
-                    )
-
-            mail_code, mail_msg = smtp.mail("check@local.test")
+class SmtpPool:
+    """Reuses one SMTP session per MX host across recipients (RSET between probes).
+
+    Servers advertising PIPELINING get MAIL FROM, RCPT TO and RSET in one write.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self._timeout = timeout
+        self._conns: Dict[str, smtplib.SMTP] = {}
+        self._uses: Dict[str, int] = {}
+        # Hosts whose session may still hold an envelope and needs RSET first.
+        self._dirty: Dict[str, bool] = {}
+
+    def probe(
+        self, email: str, mx_host: str, addresses: Sequence[str] = ()
+    ) -> SmtpCheckResult:
+        if not email.isascii():
+            # Same short-circuit as main(): SMTPUTF8 probing is not supported.
+            return SmtpCheckResult("skipped", "-", "non_ascii_local_part")
+        try:
+            smtp = self._acquire(mx_host, addresses)
+            if isinstance(smtp, SmtpCheckResult):
+                return smtp  # HELO rejected, nothing to reuse
+
+            rcpt_reply: Optional[Tuple[int, bytes]] = None
+            if smtp.has_extn("pipelining"):
+                mail_reply, rcpt_reply, rset_code = _pipelined_probe(smtp, email)
+                # The trailing RSET already cleared the envelope for the next probe.
+                self._dirty[mx_host] = rset_code != 250
+            else:
+                mail_reply = smtp.mail("check@local.test")
+                self._dirty[mx_host] = True
+
+            mail_code, mail_msg = mail_reply
             if mail_code >= 400:
                 decoded = _decode_smtp_message(mail_msg)
                 return SmtpCheckResult(
@@ -195,33 +471,167 @@ def smtp_probe(email: str, mx_host: str, timeout: float) -> SmtpCheckResult:
                     f"mail_from_rejected:{decoded}",
                 )
 
-            rcpt_code, rcpt_msg = smtp.rcpt(email)
+            if rcpt_reply is None:
+                rcpt_reply = smtp.rcpt(email)
+            rcpt_code, rcpt_msg = rcpt_reply
             decoded = _decode_smtp_message(rcpt_msg)
             return SmtpCheckResult(
                 classify_smtp(rcpt_code, decoded),
                 str(rcpt_code),
                 decoded or "rcpt_response_empty",
             )
-    except smtplib.SMTPRecipientsRefused as exc:
-        refused = exc.recipients.get(email)
-        if refused:
-            code, msg = refused
-            decoded = _decode_smtp_message(msg)
-            return SmtpCheckResult(classify_smtp(code, decoded), str(code), decoded)
-        return SmtpCheckResult("server_blocked", "-", "recipients_refused")
-    except (smtplib.SMTPConnectError, smtplib.SMTPServerDisconnected) as exc:
-        return SmtpCheckResult("connection_error", "-", type(exc).__name__)
-    except (TimeoutError, socket.timeout, ConnectionRefusedError, OSError) as exc:
-        return SmtpCheckResult("connection_error", "-", type(exc).__name__)
-    except smtplib.SMTPResponseException as exc:
-        decoded = _decode_smtp_message(exc.smtp_error)
-        return SmtpCheckResult(
-            classify_smtp(exc.smtp_code, decoded), str(exc.smtp_code), decoded
+        except smtplib.SMTPRecipientsRefused as exc:
+            self._discard(mx_host)
+            refused = exc.recipients.get(email)
+            if refused:
+                code, msg = refused
+                decoded = _decode_smtp_message(msg)
+                return SmtpCheckResult(classify_smtp(code, decoded), str(code), decoded)
+            return SmtpCheckResult("server_blocked", "-", "recipients_refused")
+        except (smtplib.SMTPConnectError, smtplib.SMTPServerDisconnected) as exc:
+            self._discard(mx_host)
+            return SmtpCheckResult("connection_error", "-", type(exc).__name__)
+        except (TimeoutError, socket.timeout, ConnectionRefusedError, OSError) as exc:
+            self._discard(mx_host)
+            return SmtpCheckResult("connection_error", "-", type(exc).__name__)
+        except smtplib.SMTPResponseException as exc:
+            self._discard(mx_host)
+            decoded = _decode_smtp_message(exc.smtp_error)
+            return SmtpCheckResult(
+                classify_smtp(exc.smtp_code, decoded), str(exc.smtp_code), decoded
+            )
+        except Exception as exc:  # defensive fallback for SMTP layer
+            self._discard(mx_host)
+            return SmtpCheckResult(
+                "server_blocked", "-", f"smtp_error:{type(exc).__name__}"
+            )
+
+    def close(self) -> None:
+        for mx_host in list(self._conns):
+            self._discard(mx_host)
+
+    def _acquire(
+        self, mx_host: str, addresses: Sequence[str]
+    ) -> Union[smtplib.SMTP, SmtpCheckResult]:
+        smtp = self._conns.get(mx_host)
+        if (
+            smtp is not None
+            and self._uses[mx_host] < SMTP_MAX_RCPT_PER_CONNECTION
+            and not _peer_closed(smtp)
+            and (not self._dirty[mx_host] or _rset_ok(smtp))
+        ):
+            self._uses[mx_host] += 1
+            return smtp
+        # Stale, exhausted or missing session: start over with a fresh one.
+        self._discard(mx_host)
+
+        smtp = self._connect(mx_host, addresses)
+        code, message = smtp.ehlo()
+        if code >= 400:
+            code, message = smtp.helo()
+            if code >= 400:
+                _quit_quietly(smtp)
+                decoded = _decode_smtp_message(message)
+                return SmtpCheckResult(
+                    "server_blocked",
+                    str(code),
+                    f"helo_rejected:{decoded}",
+                )
+
+        self._conns[mx_host] = smtp
+        self._uses[mx_host] = 1
+        self._dirty[mx_host] = False
+        return smtp
+
+    def _connect(self, mx_host: str, addresses: Sequence[str]) -> smtplib.SMTP:
+        # Try every A record in turn, as socket.create_connection would for the
+        # host name, so one dead address of a multi-homed MX is not fatal.
+        hosts = list(addresses) or [mx_host]
+        for host in hosts[:-1]:
+            try:
+                return self._open(host)
+            except OSError:  # includes SMTPConnectError
+                continue
+        return self._open(hosts[-1])
+
+    def _open(self, host: str) -> smtplib.SMTP:
+        return smtplib.SMTP(
+            host=host,
+            port=25,
+            local_hostname=_local_hostname(),
+            timeout=self._timeout,
         )
-    except UnicodeEncodeError:
-        return SmtpCheckResult("server_blocked", "-", "email_encoding_error")
-    except Exception as exc:  # defensive fallback for SMTP layer
-        return SmtpCheckResult("server_blocked", "-", f"smtp_error:{type(exc).__name__}")
+
+    def _discard(self, mx_host: str) -> None:
+        self._uses.pop(mx_host, None)
+        self._dirty.pop(mx_host, None)
+        smtp = self._conns.pop(mx_host, None)
+        if smtp is not None:
+            _quit_quietly(smtp)
+
+
+@lru_cache(maxsize=None)
+def _local_hostname() -> str:
+    # Resolved on the first connection instead of by smtplib on every one.
+    return socket.getfqdn()
+
+
+def _pipelined_probe(
+    smtp: smtplib.SMTP, email: str
+) -> Tuple[Tuple[int, bytes], Tuple[int, bytes], int]:
+    # RFC 2920: one write for the whole envelope, then drain the three replies.
+    smtp.send(
+        b"MAIL FROM:<check@local.test>\r\nRCPT TO:<%s>\r\nRSET\r\n"
+        % email.encode("ascii")
+    )
+    mail_reply = smtp.getreply()
+    rcpt_reply = smtp.getreply()
+    rset_code, _ = smtp.getreply()
+    return mail_reply, rcpt_reply, rset_code
+
+
+def _peer_closed(smtp: smtplib.SMTP) -> bool:
+    # An idle session with pending input got EOF or an unsolicited 421.
+    if smtp.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([smtp.sock], [], [], 0)
+    except (OSError, TypeError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _rset_ok(smtp: smtplib.SMTP) -> bool:
+    try:
+        code, _ = smtp.rset()
+    except smtplib.SMTPException:
+        return False
+    return code == 250
+
+
+def _quit_quietly(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.quit()
+    except (smtplib.SMTPException, OSError):
+        smtp.close()
+
+
+def _probe_host(
+    pool: SmtpPool,
+    mx_host: str,
+    addresses: Sequence[str],
+    batch: List[Tuple[int, str]],
+) -> List[Tuple[int, SmtpCheckResult]]:
+    # One worker drives all recipients of a host through the same session.
+    return [(index, pool.probe(email, mx_host, addresses)) for index, email in batch]
+
+
+def smtp_probe(email: str, mx_host: str, timeout: float) -> SmtpCheckResult:
+    pool = SmtpPool(timeout)
+    try:
+        return pool.probe(email, mx_host)
+    finally:
+        pool.close()
 
 
 def _decode_smtp_message(message: object) -> str:
@@ -230,56 +640,129 @@ def _decode_smtp_message(message: object) -> str:
     return str(message).strip()
 
 
+async def _gather_domain_checks(
+    domains: Sequence[str], timeout: float
+) -> Dict[str, DomainCheckResult]:
+    resolver = build_resolver(timeout, factory=dns.asyncresolver.Resolver)
+    sem = asyncio.Semaphore(DNS_CONCURRENCY)
+
+    async def check(domain: str) -> DomainCheckResult:
+        async with sem:
+            return await check_domain_mx_async(domain, resolver)
+
+    results = await asyncio.gather(*(check(domain) for domain in domains))
+    return dict(zip(domains, results))
+
+
+def _has_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def resolve_domains(
+    domains: Sequence[str], timeout: float, cache: Optional[MxCache] = None
+) -> Dict[str, DomainCheckResult]:
+    results: Dict[str, DomainCheckResult] = {}
+    if cache is not None:
+        try:
+            for domain in domains:
+                cached = cache.get(domain)
+                if cached is not None:
+                    results[domain] = cached
+        except sqlite3.Error as exc:  # e.g. "database is locked" by another run
+            _warn_cache_disabled(exc)
+            cache = None
+    missing = [domain for domain in domains if domain not in results]
+    if not missing:
+        return results
+
+    if HAS_ASYNC_DNS and not _has_running_loop():
+        fresh = asyncio.run(_gather_domain_checks(missing, timeout))
+    else:
+        # Sync fallback: old dnspython or called from inside an event loop.
+        resolver = build_resolver(timeout)
+        fresh = {domain: check_domain_mx(domain, resolver) for domain in missing}
+
+    if cache is not None:
+        try:
+            cache.put_many(fresh)
+        except sqlite3.Error as exc:
+            _warn_cache_disabled(exc)
+    results.update(fresh)
+    return results
+
+
 def format_table(rows: List[Dict[str, str]], columns: List[str]) -> str:
-    widths = {
-        col: max(len(col), max((len(row.get(col, "")) for row in rows), default=0))
-        for col in columns
-    }
-    sep = " | "
-    header = sep.join(col.ljust(widths[col]) for col in columns)
-    divider = "-+-".join("-" * widths[col] for col in columns)
-    lines = [header, divider]
-    for row in rows:
-        lines.append(sep.join(row.get(col, "").ljust(widths[col]) for col in columns))
+    table = [[row.get(col, "") for col in columns] for row in rows]
+    widths = [len(col) for col in columns]
+    for index, values in enumerate(zip(*table)):
+        widths[index] = max(widths[index], max(map(len, values)))
+    fmt = " | ".join(f"{{:<{width}}}" for width in widths)
+    divider = "-+-".join("-" * width for width in widths)
+    lines = [fmt.format(*columns), divider]
+    lines.extend(fmt.format(*values) for values in table)
     return "\n".join(lines)
 
 
+def write_rows(
+    rows: List[Dict[str, str]], columns: List[str], output: Optional[str]
+) -> None:
+    if output is None:
+        output = "table" if len(rows) <= TABLE_MAX_ROWS else "csv"
+    if output == "table":
+        print(format_table(rows, columns))
+        return
+    writer = csv.writer(
+        sys.stdout, delimiter="\t" if output == "tsv" else ",", lineterminator="\n"
+    )
+    writer.writerow(columns)
+    writer.writerows([row.get(col, "") for col in columns] for row in rows)
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parse_args(argv)
-    resolver = build_resolver(args.dns_timeout)
-    domain_cache: Dict[str, DomainCheckResult] = {}
 
-    rows: List[Dict[str, str]] = []
+    # Validate and IDNA-encode each address once; (email, domain, error detail).
+    parsed: List[Tuple[str, Optional[str], str]] = []
+    unique_domains: Dict[str, None] = {}
     for email in args.emails:
         normalized_email = email.strip()
-
-        if not is_valid_email(normalized_email):
-            rows.append(
-                {
-                    "email": normalized_email,
-                    "domain_status": MX_INVALID,
-                    "smtp_result": "skipped",
-                    "smtp_code": "-",
-                    "details": "invalid_email_format",
-                }
-            )
+        if not _email_match(normalized_email):
+            parsed.append((normalized_email, None, "invalid_email_format"))
             continue
-
         domain = extract_domain(normalized_email)
         if not domain:
+            parsed.append((normalized_email, None, "invalid_domain"))
+            continue
+        unique_domains[domain] = None
+        parsed.append((normalized_email, domain, ""))
+
+    mx_cache = None if args.no_cache else open_mx_cache(args.cache_ttl_max)
+    try:
+        domain_cache = resolve_domains(list(unique_domains), args.dns_timeout, mx_cache)
+    finally:
+        if mx_cache is not None:
+            mx_cache.close()
+
+    rows: List[Dict[str, str]] = []
+    by_host: Dict[str, List[Tuple[int, str]]] = {}
+    mx_addresses: Dict[str, List[str]] = {}
+    for normalized_email, domain, error_detail in parsed:
+        if domain is None:
             rows.append(
                 {
                     "email": normalized_email,
                     "domain_status": MX_INVALID,
                     "smtp_result": "skipped",
                     "smtp_code": "-",
-                    "details": "invalid_domain",
+                    "details": error_detail,
                 }
             )
             continue
 
-        if domain not in domain_cache:
-            domain_cache[domain] = check_domain_mx(domain, resolver)
         domain_result = domain_cache[domain]
 
         row = {
@@ -291,16 +774,37 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         }
 
         if domain_result.status == DOMAIN_VALID:
-            primary_mx = domain_result.mx_hosts[0]
-            smtp_result = smtp_probe(normalized_email, primary_mx, args.smtp_timeout)
-            row["smtp_result"] = smtp_result.result
-            row["smtp_code"] = smtp_result.code
-            row["details"] = f"mx:{primary_mx}; {smtp_result.detail}"
+            if not normalized_email.isascii():
+                # Non-ASCII local parts need SMTPUTF8; not worth a handshake here.
+                row["details"] = "non_ascii_local_part"
+            else:
+                primary_mx = domain_result.mx_hosts[0]
+                batch = by_host.setdefault(primary_mx, [])
+                batch.append((len(rows), normalized_email))
+                mx_addresses[primary_mx] = domain_result.mx_ips
 
         rows.append(row)
 
+    with contextlib.ExitStack() as stack:
+        pool = SmtpPool(args.smtp_timeout)
+        stack.callback(pool.close)
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=args.workers))
+        futures = {
+            executor.submit(
+                _probe_host, pool, primary_mx, mx_addresses[primary_mx], batch
+            ): primary_mx
+            for primary_mx, batch in by_host.items()
+        }
+        for future in as_completed(futures):
+            primary_mx = futures[future]
+            for index, smtp_result in future.result():
+                row = rows[index]
+                row["smtp_result"] = smtp_result.result
+                row["smtp_code"] = smtp_result.code
+                row["details"] = f"mx:{primary_mx}; {smtp_result.detail}"
+
     columns = ["email", "domain_status", "smtp_result", "smtp_code", "details"]
-    print(format_table(rows, columns))
+    write_rows(rows, columns, args.output)
     return 0
 
 
@@ -12,15 +12,50 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import random
 import re
 import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
 from urllib import error, request
+from urllib.parse import unquote
+
+try:
+    import urllib3  # optional: keep-alive connection to api.telegram.org
+
+    HAS_URLLIB3 = True
+except ImportError:
+    HAS_URLLIB3 = False
+
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[str], Any]
+
+try:
+    import orjson  # optional: faster JSON encoding of large message payloads
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _dumps = _json_dumps
+    _loads = json.loads
 
 MAX_TELEGRAM_MESSAGE_LENGTH = 4096
+MAX_BACKOFF_EXPONENT = 6  # caps the jittered back-off window at 64s
+
+_CHAT_ID_RE = re.compile(r"-?\d+")
+
+_RANDOM = random.SystemRandom()
+
+TELEGRAM_API_HOST = "api.telegram.org"
+
+_POOL: Optional["urllib3.PoolManager"] = None
+_POOL_READY = False
 
 
 class InputValidationError(Exception):
@@ -75,7 +110,7 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
 
 
 def validate_args(args: argparse.Namespace) -> None:
-    if not re.fullmatch(r"-?\d+", str(args.chat_id)):
+    if not _CHAT_ID_RE.fullmatch(str(args.chat_id)):
         raise InputValidationError(
             "Invalid --chat-id. Expected numeric value, e.g. 123456789 or -1001234567890."
         )
@@ -101,15 +136,13 @@ def read_text_file(file_path: str) -> str:
     if not path.exists() or not path.is_file():
         raise InputValidationError(f"Input file not found: {path}")
 
+    # utf-8-sig decodes plain UTF-8 too; a retry with utf-8 could never succeed.
     try:
         content = path.read_text(encoding="utf-8-sig")
-    except UnicodeDecodeError:
-        try:
-            content = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError as exc:
-            raise InputValidationError(
-                "Unable to decode file as UTF-8/UTF-8 with BOM."
-            ) from exc
+    except UnicodeDecodeError as exc:
+        raise InputValidationError(
+            "Unable to decode file as UTF-8/UTF-8 with BOM."
+        ) from exc
     except OSError as exc:
         raise InputValidationError(f"Failed to read file: {exc}") from exc
 
@@ -124,29 +157,24 @@ def split_into_chunks(text: str, limit: int = MAX_TELEGRAM_MESSAGE_LENGTH) -> Li
         raise ValueError("limit must be > 0")
 
     chunks: List[str] = []
-    remaining = text
     separators = ("\n\n", "\n", " ")
-
-    while remaining:
-        if len(remaining) <= limit:
-            chunks.append(remaining)
-            break
-
-        window = remaining[:limit]
-        split_index = -1
-        for separator in separators:
-            pos = window.rfind(separator)
-            if pos > 0:
-                split_index = pos + len(separator)
-                break
-
-        if split_index <= 0:
-            split_index = limit
-
-        chunk = remaining[:split_index]
-        if chunk:
-            chunks.append(chunk)
-        remaining = remaining[split_index:]
+    start = 0
+    text_length = len(text)
+
+    # Scan by index instead of re-slicing the remainder, which is quadratic.
+    while start < text_length:
+        end = start + limit
+        if end < text_length:
+            for separator in separators:
+                pos = text.rfind(separator, start, end)
+                if pos > start:
+                    end = pos + len(separator)
+                    break
+        else:
+            end = text_length
+
+        chunks.append(text[start:end])
+        start = end
 
     return chunks
 
@@ -160,18 +188,45 @@ def _parse_retry_after(payload: Dict[str, Any]) -> Optional[int]:
     return None
 
 
-def _build_api_error(status_code: int, raw_body: str) -> TelegramAPIError:
+class _ResponseHeaders(Protocol):
+    """The part of http.client.HTTPMessage / urllib3 HTTPHeaderDict we read."""
+
+    def get(self, name: str, /) -> Optional[str]: ...
+
+
+def _parse_retry_after_header(headers: Optional[_ResponseHeaders]) -> Optional[int]:
+    if headers is None:
+        return None
+    value = (headers.get("Retry-After") or "").strip()
+    # Only the delay-seconds form; Telegram never sends an HTTP-date here.
+    # isdecimal(), not isdigit(): the latter accepts "²", which int() rejects.
+    return int(value) if value.isascii() and value.isdecimal() else None
+
+
+def _build_api_error(
+    status_code: int,
+    raw_body: str,
+    payload: Optional[Dict[str, Any]] = None,
+    headers: Optional[_ResponseHeaders] = None,
+) -> TelegramAPIError:
     description = raw_body.strip() or "Unknown Telegram API error"
-    retry_after: Optional[int] = None
+    retry_after = _parse_retry_after_header(headers)
 
-    try:
-        payload = json.loads(raw_body)
-    except json.JSONDecodeError:
-        return TelegramAPIError(status_code=status_code, description=description)
+    if payload is None:
+        try:
+            payload = _loads(raw_body)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+            return TelegramAPIError(
+                status_code=status_code,
+                description=description,
+                retry_after=retry_after,
+            )
 
     if isinstance(payload, dict):
         description = str(payload.get("description", description))
-        retry_after = _parse_retry_after(payload)
+        body_retry_after = _parse_retry_after(payload)
+        if body_retry_after is not None:
+            retry_after = body_retry_after
         api_error_code = payload.get("error_code")
         if isinstance(api_error_code, int):
             status_code = api_error_code
@@ -183,28 +238,68 @@ def _build_api_error(status_code: int, raw_body: str) -> TelegramAPIError:
     )
 
 
-def telegram_api_post(
-    token: str,
-    method: str,
-    payload: Dict[str, Any],
-    timeout: float,
-) -> Dict[str, Any]:
-    url = f"https://api.telegram.org/bot{token}/{method}"
-    body = json.dumps(payload).encode("utf-8")
-    req = request.Request(
-        url=url,
-        data=body,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+def _get_pool() -> Optional["urllib3.PoolManager"]:
+    """Return the shared urllib3 pool, or None to fall back to urllib."""
+    global _POOL, _POOL_READY
+    if not _POOL_READY:
+        _POOL = _build_pool()
+        _POOL_READY = True
+    return _POOL
+
 
+def _build_pool() -> Optional["urllib3.PoolManager"]:
+    if not HAS_URLLIB3:
+        return None
+    # urllib honors HTTPS_PROXY/NO_PROXY on its own; urllib3 needs to be told.
+    proxy_url = request.getproxies().get("https")
+    if proxy_url and not request.proxy_bypass(TELEGRAM_API_HOST):
+        try:
+            proxy = urllib3.util.parse_url(proxy_url)
+            proxy_headers = None
+            if proxy.auth:
+                # urllib3 ignores user:pass@ in the proxy URL; send it explicitly.
+                user, _, password = proxy.auth.partition(":")
+                proxy_headers = urllib3.make_headers(
+                    proxy_basic_auth=f"{unquote(user)}:{unquote(password)}"
+                )
+                proxy_url = proxy._replace(auth=None).url
+            return urllib3.ProxyManager(
+                proxy_url,
+                num_pools=1,
+                maxsize=4,
+                retries=False,
+                proxy_headers=proxy_headers,
+            )
+        except ValueError:  # unparsable URL or a scheme urllib3 cannot speak
+            return None
+    return urllib3.PoolManager(num_pools=1, maxsize=4, retries=False)
+
+
+def _http_post_json(
+    url: str, body: bytes, timeout: float
+) -> Tuple[int, str, _ResponseHeaders]:
+    headers = {"Content-Type": "application/json"}
+
+    pool = _get_pool()
+    if pool is not None:
+        try:
+            response = pool.request(
+                "POST", url, body=body, headers=headers, timeout=timeout
+            )
+        except urllib3.exceptions.HTTPError as exc:
+            raise NetworkError(f"Network error: {exc}") from exc
+        except OSError as exc:
+            raise NetworkError(f"OS/network error: {exc}") from exc
+        raw = response.data.decode("utf-8", errors="replace")
+        return response.status, raw, response.headers
+
+    req = request.Request(url=url, data=body, headers=headers, method="POST")
     try:
         with request.urlopen(req, timeout=timeout) as response:
-            status = response.getcode()
-            raw_response = response.read().decode("utf-8", errors="replace")
+            raw = response.read().decode("utf-8", errors="replace")
+            return response.getcode(), raw, response.headers
     except error.HTTPError as exc:
-        raw_error = exc.read().decode("utf-8", errors="replace")
-        raise _build_api_error(exc.code, raw_error) from exc
+        return exc.code, exc.read().decode("utf-8", errors="replace"), exc.headers
     except error.URLError as exc:
         raise NetworkError(f"Network error: {exc.reason}") from exc
     except TimeoutError as exc:
@@ -212,11 +307,22 @@ def telegram_api_post(
     except OSError as exc:
         raise NetworkError(f"OS/network error: {exc}") from exc
 
+
+def telegram_api_post(
+    token: str,
+    method: str,
+    payload: Dict[str, Any],
+    timeout: float,
+) -> Dict[str, Any]:
+    url = f"https://{TELEGRAM_API_HOST}/bot{token}/{method}"
+    body = _dumps(payload)
+    status, raw_response, headers = _http_post_json(url, body, timeout)
+
     if status < 200 or status >= 300:
-        raise _build_api_error(status, raw_response)
+        raise _build_api_error(status, raw_response, headers=headers)
 
     try:
-        parsed = json.loads(raw_response)
+        parsed = _loads(raw_response)
     except json.JSONDecodeError as exc:
         raise TelegramAPIError(
             status_code=status, description="Telegram returned non-JSON response"
@@ -228,7 +334,7 @@ def telegram_api_post(
         )
 
     if not parsed.get("ok", False):
-        raise _build_api_error(status, raw_response)
+        raise _build_api_error(status, raw_response, payload=parsed, headers=headers)
 
     return parsed
 
@@ -240,8 +346,8 @@ def _is_retryable_api_error(exc: TelegramAPIError) -> bool:
 def _retry_delay_seconds(attempt_number: int, retry_after: Optional[int]) -> int:
     if retry_after is not None:
         return retry_after
-    # 1, 2, 4 for attempts 1, 2, 3...
-    return 2 ** (attempt_number - 1)
+    # Full jitter over 1, 2, 4... (capped) so parallel senders do not retry in lockstep.
+    return _RANDOM.randint(0, 1 << min(attempt_number - 1, MAX_BACKOFF_EXPONENT))
 
 
 def send_chunk_with_retry(
@@ -297,7 +403,22 @@ def send_text(
     timeout: float,
     max_retries: int,
 ) -> int:
-    chunks = split_into_chunks(text)
+    return send_chunks(
+        token=token,
+        chat_id=chat_id,
+        chunks=split_into_chunks(text),
+        timeout=timeout,
+        max_retries=max_retries,
+    )
+
+
+def send_chunks(
+    token: str,
+    chat_id: str,
+    chunks: List[str],
+    timeout: float,
+    max_retries: int,
+) -> int:
     total_attempts = 0
 
     print(f"Prepared {len(chunks)} chunk(s) for sending.")
@@ -322,18 +443,18 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
         token = load_token_from_env()
         text = read_text_file(args.file_path)
+        chunks = split_into_chunks(text)
 
-        attempts = send_text(
+        attempts = send_chunks(
             token=token,
             chat_id=str(args.chat_id),
-            text=text,
+            chunks=chunks,
             timeout=args.timeout,
             max_retries=args.max_retries,
         )
 
-        chunk_count = len(split_into_chunks(text))
         print(
-            f"Done: sent {chunk_count} chunk(s) successfully, total attempts: {attempts}."
+            f"Done: sent {len(chunks)} chunk(s) successfully, total attempts: {attempts}."
         )
         return 0
     except InputValidationError as exc: